@@ -8,12 +8,19 @@ import csv
 import logging
 import os
 import sys
+import threading
 import time
+from collections import deque
+from contextlib import ExitStack
 from datetime import timedelta
 
 from zke_ebc_axx.device import EBCDevice
 from zke_ebc_axx.exceptions import CommunicationError
 
+# Bound once at import; write() is on the hot path for fast callbacks
+_time = time.time
+_log = logging.getLogger(__name__)
+
 
 def setup_logging(debug_enabled=False, debug_file=None):
     """Set up logging configuration based on command-line arguments."""
@@ -34,10 +41,12 @@ def setup_logging(debug_enabled=False, debug_file=None):
         logger.setLevel(logging.DEBUG)
 
         if debug_file:
-            # Debug to file
+            # Debug to file. Use the raw %(created)f timestamp here: asctime
+            # would call localtime/strftime per record, which dominates
+            # logging CPU at high row rates. Console keeps the human format.
             file_handler = logging.FileHandler(debug_file)
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(logging.Formatter("%(created).3f [%(levelname)s] %(message)s"))
             logger.addHandler(file_handler)
         else:
             # Debug to console (lower console handler level to DEBUG)
@@ -46,37 +55,175 @@ def setup_logging(debug_enabled=False, debug_file=None):
         logger.setLevel(logging.INFO)
 
 
+class _AsciiFile:
+    """Text-to-bytes shim over a binary file.
+
+    CSV output is pure ASCII, so writing to a binary file through this shim
+    skips the TextIOWrapper layer and costs one encode per buffered batch
+    instead of per-row text-layer bookkeeping.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, s):
+        self.raw.write(s.encode("ascii"))
+
+    def flush(self):
+        self.raw.flush()
+
+
+class _Appender:
+    """File-like shim that lets csv.writer emit into a list of strings."""
+
+    def __init__(self, buf):
+        self.buf = buf
+
+    def write(self, s):
+        self.buf.append(s)
+
+
+def _needs_quoting(values):
+    """Return True if any value would need CSV quoting or escaping."""
+    for v in values:
+        if isinstance(v, str) and ("," in v or '"' in v or "\n" in v or "\r" in v):
+            return True
+    return False
+
+
 # Set up logging configuration
 class Writer:
-    def __init__(self, file):
+    """Buffered CSV writer.
+
+    Rows are buffered and flushed in batches to avoid a write+flush syscall
+    per measurement. Use flush_interval=1 to get the old flush-per-row
+    behavior when data safety matters more than throughput.
+    """
+
+    def __init__(self, file, flush_interval=50, flush_period=1.0):
         self.file = file
-        self.csv_writer = None
         self.initialized = False
+        self.flush_interval = flush_interval
+        self.flush_period = flush_period
+        self._fields = None
+        self._writer = None
+        self._buffer = []
+        self._last_flush = time.time()
 
     def init(self, fieldnames):
-        self.csv_writer = csv.DictWriter(self.file, fieldnames=fieldnames)
-        self.csv_writer.writeheader()
+        # The schema is fixed after the first row, so precompute a format
+        # string for it ("{time},{mode},...\r\n") and bypass the csv module
+        # entirely for rows whose values never need quoting. Rows that do
+        # need quoting go through a csv.writer emitting into the same buffer.
+        self._fields = tuple(fieldnames)
+        self._fieldset = frozenset(self._fields)
+        self._fmt = ",".join("{" + f + "}" for f in self._fields) + "\r\n"
+        self._writer = csv.writer(_Appender(self._buffer))
+        self._writer.writerow(self._fields)
+        # Preallocated value buffer for the quoting fallback; reused across
+        # rows so the fallback doesn't allocate a fresh list per row.
+        self._row_buf = [None] * len(self._fields)
+        # Bound methods for the hot path, resolved once instead of per row
+        self._format_row = self._fmt.format_map
+        self._append_line = self._buffer.append
         self.initialized = True
 
     def write(self, row):
-        row["time"] = time.time()
-        row.move_to_end("time", last=False)
+        # Plain dicts preserve insertion order (3.7+), so build a fresh dict
+        # with "time" first instead of mutating an OrderedDict in place.
+        row = {"time": _time(), **row}
 
         if not self.initialized:
             self.init(row.keys())
-        logging.debug("Writing row: %s", row)
-        self.csv_writer.writerow(row)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Writing row: %s", row)
+        # The format-string fast path requires every schema field; rows
+        # missing one fall back to the csv.writer path, which writes an
+        # empty cell like the old DictWriter did.
+        if not row.keys() >= self._fieldset or _needs_quoting(row.values()):
+            buf = self._row_buf
+            for i, k in enumerate(self._fields):
+                buf[i] = row.get(k, "")
+            self._writer.writerow(buf)
+        else:
+            self._append_line(self._format_row(row))
+        if len(self._buffer) >= self.flush_interval or _time() - self._last_flush >= self.flush_period:
+            self.flush()
+
+    def flush(self):
+        """Write out any buffered rows and flush the underlying file."""
+        if self._buffer:
+            self.file.write("".join(self._buffer))
+            self._buffer.clear()
         self.file.flush()
+        self._last_flush = time.time()
+
+    def close(self):
+        """Flush the tail of the buffer; call before the file is closed."""
+        if self.initialized:
+            self.flush()
+
+
+def _reader_loop(device, ring, data_ready, stop, failure):
+    """Producer thread: pull frames off the serial port into the ring."""
+    # Hoist attribute lookups out of the loop; each is a dict hit per pass.
+    wait_readable = device.wait_readable
+    read_measurements = device.read_measurements
+    extend = ring.extend
+    notify = data_ready.set
+    stopped = stop.is_set
+    try:
+        while not stopped():
+            wait_readable(1.0)
+            frames = read_measurements()
+            if frames:
+                extend(frames)
+                notify()
+    except Exception as e:
+        # Stash the error for the consumer and wake it up; a silently dead
+        # reader would leave log_forever waiting on an empty ring forever.
+        failure.append(e)
+        notify()
+
+
+def _write_status(row):
+    """Overwrite a single terminal status line instead of streaming CSV rows."""
+    sys.stdout.write(
+        "\rV={u_measured:7.3f} I={i_measured:7.3f} Q={stored_charge:6.1f} {state:<10}".format_map(row)
+    )
+    sys.stdout.flush()
 
 
-def log_forever(device, writer):
-    # Log data until the device is in a completed state
-    while True:
-        time.sleep(1)
-        data = device.read_measurement()
-        if not data:
-            continue
-        writer.write(data)
+def log_forever(device, write_cb):
+    # Log data until the device is in a completed state.
+    # Acquisition runs on a dedicated thread so a CSV write hiccup can't
+    # stall serial reads; the bounded ring drops the oldest rows if the
+    # consumer falls far behind.
+    ring = deque(maxlen=4096)
+    data_ready = threading.Event()
+    stop = threading.Event()
+    failure = []  # One-slot holder for an exception raised on the reader thread
+    reader = threading.Thread(
+        target=_reader_loop, args=(device, ring, data_ready, stop, failure), daemon=True
+    )
+    reader.start()
+    write = write_cb
+    popleft = ring.popleft
+    try:
+        while True:
+            data_ready.wait(1.0)
+            data_ready.clear()
+            while ring:
+                write(popleft())
+            if failure:
+                # Re-raise on the main thread so main()'s CommunicationError
+                # handler fires instead of hanging on a dead reader.
+                e = failure[0]
+                if isinstance(e, CommunicationError):
+                    raise e
+                raise CommunicationError(f"Serial reader failed: {e}") from e
+    finally:
+        stop.set()
 
 
 def handle_action(device, writer, args):
@@ -97,9 +244,12 @@ def handle_action(device, writer, args):
         logging.info("Starting discharge CV... Voltage: %sV", args.voltage)
         device.discharge_cv(target_voltage=args.voltage, writer_cb=writer.write)
     else:
-        # Default to monitor mode
+        # Default to monitor mode. On an interactive terminal a single
+        # overwritten status line beats streaming one CSV row (and one
+        # flush) per measurement at the user.
         logging.info("Starting monitoring mode...")
-        log_forever(device, writer)
+        fmt = args.monitor_format or ("status" if not args.output and sys.stdout.isatty() else "csv")
+        log_forever(device, _write_status if fmt == "status" else writer.write)
 
 
 def main():
@@ -127,6 +277,12 @@ def main():
     action_group.add_argument("--discharge-cp", action="store_true", help="Perform discharge CP operation")
     action_group.add_argument("--discharge-cv", action="store_true", help="Perform discharge CV operation")
     action_group.add_argument("--monitor", action="store_true", help="Monitor mode (default)")
+    parser.add_argument(
+        "--monitor-format",
+        choices=["csv", "status"],
+        default=None,
+        help="Monitor mode output: CSV rows or a single status line (default: status on a TTY)",
+    )
 
     # Parameters for actions
     parser.add_argument("-c", "--current", type=float, default=1.0, help="Current in amperes (default: 1.0)")
@@ -142,34 +298,52 @@ def main():
 
     output_file = args.output
 
-    # Check if output file exists and handle accordingly
-    if output_file and os.path.exists(output_file) and not (args.force or args.append):
+    # Determine file mode: "x" fails atomically if the file already exists,
+    # replacing the racy os.path.exists check with a single open syscall.
+    if args.append:
+        file_mode = "a"
+    elif args.force:
+        file_mode = "w"
+    else:
+        file_mode = "x"
+
+    # Large buffer: rows are drained on Writer's batch boundaries, so the
+    # default 8 KiB buffer would just force extra write() syscalls. The file
+    # is opened binary and wrapped in _AsciiFile to skip the text layer.
+    try:
+        output = open(output_file, file_mode + "b", buffering=1 << 20) if output_file else sys.stdout
+    except FileExistsError:
         print(
             f"Error: Output file '{output_file}' already exists. Use -f/--force to overwrite or -a/--append to append."
         )
         sys.exit(1)
 
-    # Determine file mode based on append flag
-    file_mode = "a" if args.append and output_file and os.path.exists(output_file) else "w"
+    with ExitStack() as stack:
+        csvfile = stack.enter_context(output) if output_file else output
+        writer = Writer(_AsciiFile(csvfile) if output_file else csvfile)
 
-    with open(output_file, file_mode, newline="") if output_file else sys.stdout as csvfile:
-        writer = Writer(csvfile)
+        device = EBCDevice(port=args.port, baudrate=9600)
 
-        device = EBCDevice(port=args.port, baudrate=9600, timeout=1.0)
+        # Cleanup callbacks run in reverse registration order: flush the
+        # writer, stop and disconnect the device, then fsync the CSV — all
+        # before the file itself is closed by the enter_context above.
+        if output_file:
+            # One fsync at the end is enough for data safety; flushing
+            # every row would defeat the buffering above.
+            stack.callback(os.fsync, csvfile.fileno())
+            stack.callback(csvfile.flush)
+        stack.callback(device.disconnect)
+        stack.callback(device.send_stop)
+        stack.callback(writer.close)
 
         try:
             device.send_stop()
-            time.sleep(1)
+            device.wait_until_idle()
             handle_action(device, writer, args)
         except KeyboardInterrupt:
             logging.info("Operation interrupted by user")
-            return
         except CommunicationError as e:
             logging.warning("Error: %s", e)
-        finally:
-            # Always disconnect properly
-            device.send_stop()
-            device.disconnect()
 
 
 if __name__ == "__main__":
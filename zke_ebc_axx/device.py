@@ -1,17 +1,59 @@
-import binascii
 import logging
+import operator
+import select
+import struct
 import time
-from collections import OrderedDict
+from functools import reduce
 from datetime import timedelta
 
 import serial
 
+try:  # Optional: JIT-compile the numeric frame decode when numba is present
+    from numba import njit
+except ImportError:
+    njit = None
+
 from .constants import MODE
 from .exceptions import CommandError, CommunicationError
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Fixed line settings for the EBC protocol (8E1), shared by every
+# (re)connect; stopbits=1 and rtscts=False match the pyserial defaults
+# and are omitted
+_SERIAL_KW = {"bytesize": serial.EIGHTBITS, "parity": serial.PARITY_EVEN}
+
+# Compiled once: a full 19-byte response frame as unsigned bytes
+_FRAME = struct.Struct(">19B")
+
+# Precomputed wire encoding for every legal 16-bit value (0-57599): the
+# protocol offset and MSB/LSB split collapse to a single tuple index at
+# call time instead of per-call arithmetic and bytes construction.
+_ENCODE_TABLE = tuple((v + v // 240 * 16).to_bytes(2, "big") for v in range(57600))
+
+
+def _decode_frame_fields(buf):
+    """Checksum plus the six pair-decoded numeric fields of one raw frame."""
+    chk = 0
+    for i in range(1, 17):
+        chk ^= buf[i]
+    i_measured = (buf[2] << 8 | buf[3]) - buf[2] * 16
+    u_measured = (buf[4] << 8 | buf[5]) - buf[4] * 16
+    stored_charge = (buf[6] << 8 | buf[7]) - buf[6] * 16
+    i_setting = (buf[10] << 8 | buf[11]) - buf[10] * 16
+    u_cutoff = (buf[12] << 8 | buf[13]) - buf[12] * 16
+    max_time = (buf[14] << 8 | buf[15]) - buf[14] * 16
+    return chk, i_measured, u_measured, stored_charge, i_setting, u_cutoff, max_time
+
+
+if njit is not None:
+    # Compiled once, cached across runs; the scalar XOR/shift arithmetic is
+    # exactly the kind of loop numba collapses to native code
+    _decode_frame_fields_nb = njit(cache=True)(_decode_frame_fields)
+else:
+    _decode_frame_fields_nb = None
+
 
 class EBCDevice:
     """
@@ -21,7 +63,7 @@ class EBCDevice:
     # Protocol constants
     INIT_BYTE = 0xFA  # First byte of each packet "FA"
     END_BYTE = 0xF8  # Last byte of each packet "F8"
-    DEFAULT_TIMEOUT = 1.0  # Default timeout for responses
+    DEFAULT_TIMEOUT = 1.5  # Default timeout for responses; covers one ~1 Hz frame interval
     COMMAND_LENGTH = 10  # Command is 10 bytes
     RESPONSE_LENGTH = 19  # Response is 19 bytes
 
@@ -73,7 +115,14 @@ class EBCDevice:
     CMD_ADJUST = 0x07
     CMD_CONTINUE = 0x08
 
-    def __init__(self, port, baudrate=9600, timeout=1.0):
+    # Fixed zero-payload system packets, precomputed in full: with MODE_SYS=0
+    # and an all-zero payload the checksum is just the command byte, so these
+    # never need validation, assembly or checksumming at send time
+    _PKT_CONNECT = bytes([INIT_BYTE, CMD_CONNECT, 0, 0, 0, 0, 0, 0, CMD_CONNECT, END_BYTE])
+    _PKT_DISCONNECT = bytes([INIT_BYTE, CMD_DISCONNECT, 0, 0, 0, 0, 0, 0, CMD_DISCONNECT, END_BYTE])
+    _PKT_STOP = bytes([INIT_BYTE, CMD_STOP, 0, 0, 0, 0, 0, 0, CMD_STOP, END_BYTE])
+
+    def __init__(self, port, baudrate=9600, timeout=DEFAULT_TIMEOUT):
         """
         Initialize the EBC device.
 
@@ -86,6 +135,7 @@ class EBCDevice:
         self.port = port
         self.timeout = timeout
         self._ser = None
+        self._rxbuf = bytearray()  # accumulator for bulk serial reads
         logger.info("Initializing EBC device on port %s with baudrate %d", port, baudrate)
         self.connect()
 
@@ -96,15 +146,12 @@ class EBCDevice:
             self._ser = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                bytesize=8,
-                parity="E",
-                stopbits=1,
                 timeout=self.timeout,
-                rtscts=False,
+                **_SERIAL_KW,
             )
             time.sleep(0.5)  # Allow time for device to initialize
 
-            self.send_command(self.MODE_SYS, self.CMD_CONNECT)
+            self._send_raw(self._PKT_CONNECT)
             time.sleep(0.5)
 
             logger.info("Successfully connected to device on %s", self.port)
@@ -116,7 +163,7 @@ class EBCDevice:
         """Close the connection."""
         if self._ser and self._ser.is_open:
             logger.debug("Disconnecting from device")
-            self.send_command(self.MODE_SYS, self.CMD_DISCONNECT)
+            self._send_raw(self._PKT_DISCONNECT)
             self._ser.close()
             logger.info("Device disconnected")
 
@@ -139,12 +186,31 @@ class EBCDevice:
         Returns:
             int: The calculated checksum byte
         """
-        result = 0
-        for byte in data:
-            result ^= byte
-        return result
+        # reduce() folds the XOR in C instead of one bytecode loop pass per byte
+        return reduce(operator.xor, data, 0)
+
+    def _send_raw(self, packet):
+        """
+        Write a fully precomputed packet, skipping validation and assembly.
 
-    def send_command(self, mode, command, data=None):
+        Args:
+            packet (bytes): Complete 10-byte command packet
+
+        Raises:
+            CommunicationError: If communication fails
+        """
+        if not self._ser or not self._ser.is_open:
+            logger.error("Cannot send command - device is not connected")
+            raise CommunicationError("Device is not connected")
+        try:
+            self._ser.write(packet)
+            logger.info("Command 0x%02X sent successfully", packet[1])
+            time.sleep(0.1)  # Allow time for device to process command
+        except serial.SerialException as e:
+            logger.error("Failed to send command: %s", e)
+            raise CommunicationError(f"Communication error: {e}")
+
+    def send_command(self, mode, command, data=None, post_delay=0.1):
         """
         Send a command to the device following the protocol specification.
 
@@ -152,6 +218,8 @@ class EBCDevice:
             mode (int): The mode nibble
             command (int): The command nibble (COP)
             data (bytes): Data bytes (default is all zeros)
+            post_delay (float): Seconds to wait after the write; pass 0 when
+                the caller immediately blocks on a read anyway
 
         Raises:
             CommunicationError: If communication fails
@@ -168,39 +236,36 @@ class EBCDevice:
             raise CommandError(f"Invalid command code: {command}")
         command_code = (mode << 4) | command
 
-        # Initialize data bytes if not provided
-        if data is None:
-            data_list = [0] * 6  # 6 data bytes
-        else:
-            # Convert bytes to list and ensure proper length
-            data_list = list(data)
-            if len(data_list) < 6:
-                data_list = data_list + [0] * (6 - len(data_list))  # Pad with zeros
-            elif len(data_list) > 6:
-                data_list = data_list[:6]  # Truncate to 6 bytes
-
-        # Construct command packet
+        # Construct command packet in a preallocated 10-byte buffer
         # Format: [InitByte, COP, Data1, Data2, Data3, Data4, Data5, Data6, ChSum, EndByte]
-        cmd_bytes = [self.INIT_BYTE, command_code] + data_list
-
-        # Calculate checksum (XOR of bytes 2-9)
-        checksum = self._calculate_checksum(cmd_bytes[1:8])
-        cmd_bytes.append(checksum)
-        cmd_bytes.append(self.END_BYTE)
+        buf = bytearray(self.COMMAND_LENGTH)
+        buf[0] = self.INIT_BYTE
+        buf[1] = command_code
+        if data is not None:
+            # The buffer is pre-zeroed, so short data pads itself
+            data = bytes(data[:6])
+            buf[2 : 2 + len(data)] = data
+
+        # Calculate checksum (XOR of bytes 2-9); memoryview avoids a slice copy
+        buf[8] = self._calculate_checksum(memoryview(buf)[1:8])
+        buf[9] = self.END_BYTE
 
         try:
             # Send the command
-            cmd_packet = bytes(cmd_bytes)
-            logger.debug("Sending command: 0x%02X, data: %s", command_code, [hex(b) for b in data_list])
-            logger.debug("Full packet: %s", [hex(b) for b in cmd_packet])
-            self._ser.write(cmd_packet)
+            # Guarded: building the hex dumps on every command would be
+            # wasted work in the common no-debug case
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command: 0x%02X, data: %s", command_code, buf[2:8].hex())
+                logger.debug("Full packet: %s", buf.hex())
+            self._ser.write(buf)
             logger.info("Command 0x%02X sent successfully", command_code)
-            time.sleep(0.1)  # Allow time for device to process command
+            if post_delay:
+                time.sleep(post_delay)  # Allow time for device to process command
         except serial.SerialException as e:
             logger.error("Failed to send command: %s", e)
             raise CommunicationError(f"Communication error: {e}")
 
-    def send_command_16bit(self, mode, command, arg1=0, arg2=0, arg3=0):
+    def send_command_16bit(self, mode, command, arg1=0, arg2=0, arg3=0, post_delay=0.1):
         """
         Send a command with 16-bit arguments to the device.
 
@@ -210,13 +275,14 @@ class EBCDevice:
             arg1 (int): First argument (0-57599)
             arg2 (int): Second argument (0-57599)
             arg3 (int): Third argument (0-57599)
+            post_delay (float): Forwarded to send_command
 
         Raises:
             CommunicationError: If communication fails
         """
         # Encode the arguments
         encoded_args = self.encode_value(arg1) + self.encode_value(arg2) + self.encode_value(arg3)
-        return self.send_command(mode, command, encoded_args)
+        return self.send_command(mode, command, encoded_args, post_delay=post_delay)
 
     def send_stop(self):
         """
@@ -227,7 +293,7 @@ class EBCDevice:
             CommunicationError: If communication fails
         """
         logger.debug("Sending stop command")
-        return self.send_command(self.MODE_SYS, self.CMD_STOP)
+        return self._send_raw(self._PKT_STOP)
 
     def encode_value(self, value):
         """
@@ -250,23 +316,10 @@ class EBCDevice:
         if not 0 <= value <= 57599:
             raise ValueError(f"Value must be between 0 and 57599, got {value}")
 
-        # Calculate the offset group
-        offset_group = value // 240
-
-        if offset_group == 0:
-            # Values 0-239 remain unchanged
-            encoded_value = value
-        else:
-            # For values ≥240, apply an offset of 16 for each group
-            offset = offset_group * 16
-            encoded_value = value + offset
-
-        # Calculate the two bytes (MSB, LSB)
-        msb = (encoded_value >> 8) & 0xFF
-        lsb = encoded_value & 0xFF
-
-        logger.debug("Encoded value %d to bytes: 0x%02X, 0x%02X", value, msb, lsb)
-        return bytes([msb, lsb])
+        encoded = _ENCODE_TABLE[value]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Encoded value %d to bytes: %s", value, encoded.hex())
+        return encoded
 
     def decode_value(self, data):
         """
@@ -291,9 +344,15 @@ class EBCDevice:
         encoded_value = (msb << 8) | lsb
         decoded_value = encoded_value - msb * 16
 
-        logger.debug("Decoded bytes 0x%02X, 0x%02X to value %d", msb, lsb, decoded_value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Decoded bytes 0x%02X, 0x%02X to value %d", msb, lsb, decoded_value)
         return decoded_value
 
+    @staticmethod
+    def _to_minutes(td):
+        """Whole minutes of a timedelta, using integer-only arithmetic."""
+        return td.days * 1440 + td.seconds // 60
+
     def _send_cmd_charge_predefined(self, mode, cmd, current, ncells, timeout):
         if mode not in [
             self.MODE_C_NIMH,
@@ -309,7 +368,7 @@ class EBCDevice:
             cmd,
             int(current * self.I_MULT),
             ncells,
-            int(timeout.total_seconds() / 60),
+            self._to_minutes(timeout),
         )
 
     def start_charge_predefined(self, mode, current, ncells=1, timeout=timedelta(0)):
@@ -335,12 +394,14 @@ class EBCDevice:
         self._send_cmd_charge_predefined(mode, self.CMD_ADJUST, current, ncells, timeout)
 
     def _send_cmd_charge_cccv(self, cmd, voltage, current, timeout):
+        # No post-write delay: every caller immediately blocks on a read
         self.send_command_16bit(
             self.MODE_C_CCCV,
             cmd,
             int(current * self.I_MULT),
             int(voltage * self.V_MULT),
-            int(timeout.total_seconds() / 60),
+            self._to_minutes(timeout),
+            post_delay=0,
         )
 
     def start_charge_cccv(self, voltage, current, timeout=timedelta(0)):
@@ -366,12 +427,14 @@ class EBCDevice:
         return self._send_cmd_charge_cccv(self.CMD_ADJUST, voltage, current, timeout)
 
     def _send_cmd_discharge_cc(self, cmd, current, cutoff_voltage, timeout):
+        # No post-write delay: every caller immediately blocks on a read
         self.send_command_16bit(
             self.MODE_D_CC,
             self.CMD_START,
             int(current * self.I_MULT),
             int(cutoff_voltage * self.V_MULT),
-            int(timeout.total_seconds() / 60),
+            self._to_minutes(timeout),
+            post_delay=0,
         )
 
     def start_discharge_cc(self, current, cutoff_voltage, timeout=timedelta(0)):
@@ -396,12 +459,14 @@ class EBCDevice:
         return self._send_cmd_discharge_cc(self.CMD_ADJUST, current, cutoff_voltage, timeout)
 
     def _send_cmd_discharge_cp(self, cmd, power, cutoff_voltage, timeout):
+        # No post-write delay: every caller immediately blocks on a read
         self.send_command_16bit(
             self.MODE_D_CC,
             cmd,
             int(power * self.P_MULT),
             int(cutoff_voltage * self.V_MULT),
-            int(timeout.total_seconds() / 60),
+            self._to_minutes(timeout),
+            post_delay=0,
         )
 
     def start_discharge_cp(self, power, cutoff_voltage, timeout=timedelta(0)):
@@ -434,84 +499,247 @@ class EBCDevice:
         if self._ser and self._ser.is_open:
             logger.debug("Discarding unread data from serial buffer")
             self._ser.reset_input_buffer()
+            self._rxbuf.clear()
+
+    def wait_until_idle(self, timeout=1.0):
+        """
+        Wait until the device reports an idle state or the timeout elapses.
+
+        Meant as a replacement for a fixed post-stop sleep: it returns as
+        soon as the first idle frame arrives instead of always burning the
+        full interval.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds
+
+        Returns:
+            bool: True if an idle frame was seen, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            data = self.read_measurement()
+            if data and data["state"] == "IDLE":
+                return True
+            time.sleep(0.02)
+        return False
+
+    def wait_readable(self, timeout=1.0):
+        """
+        Block until data is available on the serial port or the timeout elapses.
+
+        Returns True if a read is likely to yield data. Unlike a fixed sleep,
+        this wakes up as soon as the device sends something.
+        """
+        if self._rxbuf:
+            return True
+        readable, _, _ = select.select([self._ser], [], [], timeout)
+        return bool(readable)
 
     def read_measurement(self):
         """
         Read a measurement from the device.
+
+        Everything the OS has buffered is pulled in a single read() call and
+        accumulated, so the host can catch up after falling behind instead of
+        paying one syscall per frame.
+        """
+
+        for frame in self._drain_frames():
+            return self._parse_frame(_FRAME.unpack(frame), raw=frame)
+        return None
+
+    def _fill_rxbuf(self):
+        """One bulk read() of everything pending into the accumulator."""
+        data = self._ser.read(self._ser.in_waiting or self.RESPONSE_LENGTH)
+        # Guarded: hexlifying every read would allocate two strings per
+        # frame for the lifetime of a run even with debug off
+        if data and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received data: %s", data.hex())
+        if data:
+            self._rxbuf += data
+
+    def _drain_frames(self):
+        """
+        Pull everything queued on the serial port and yield complete raw frames.
+
+        One read() covers all pending bytes; partial frames stay in the
+        accumulator until the next call. On a framing error the buffer is
+        resynced by scanning for the next INIT_BYTE instead of flushing, so
+        a single dropped byte costs at most one frame. The value encoding
+        keeps data bytes below 0xF0, but the checksum byte can still be
+        0xFA; the END_BYTE check rejects such a misaligned candidate and
+        the scan simply continues from the next byte.
+
+        Yields:
+            bytes: Raw 19-byte response frames
+        """
+        self._fill_rxbuf()
+        rxbuf = self._rxbuf
+        while True:
+            # Resync: drop line noise in front of the next frame start
+            start = rxbuf.find(self.INIT_BYTE)
+            if start < 0:
+                rxbuf.clear()
+                return
+            if start:
+                logger.warning("Resyncing: dropping %d bytes before frame start", start)
+                del rxbuf[:start]
+            if len(rxbuf) < self.RESPONSE_LENGTH:
+                return
+            if rxbuf[self.RESPONSE_LENGTH - 1] != self.END_BYTE:
+                # Torn frame: skip this start byte and rescan
+                del rxbuf[:1]
+                continue
+            frame = bytes(rxbuf[: self.RESPONSE_LENGTH])
+            del rxbuf[: self.RESPONSE_LENGTH]
+            yield frame
+
+    def read_measurements(self):
         """
+        Read and parse all complete frames currently buffered.
 
-        data = self._ser.read(self.RESPONSE_LENGTH)
-        logging.debug("Received data: %s", binascii.hexlify(data).decode("ascii"))
-        if not data:
-            return None
+        One bulk read() covers every queued frame, so catching up after a
+        pause costs one syscall instead of one per frame. Malformed frames
+        are dropped.
 
-        if len(data) != self.RESPONSE_LENGTH:
-            logger.error("Invalid response length: expected %d, got %d", self.RESPONSE_LENGTH, len(data))
-            return None
+        Returns:
+            list: Parsed measurements, oldest first (may be empty)
+        """
+        measurements = []
+        for frame in self._drain_frames():
+            parsed = self._parse_frame(_FRAME.unpack(frame), raw=frame)
+            if parsed:
+                measurements.append(parsed)
+        return measurements
+
+    def _parse_frame(self, frame, raw=None):
+        """
+        Parse one unpacked 19-byte response frame into a measurement.
+
+        Args:
+            frame (tuple): 19 unsigned bytes as produced by _FRAME.unpack
+            raw (bytes): Original frame bytes, kept for the raw_data field
 
-        if data[0] != self.INIT_BYTE or data[-1] != self.END_BYTE:
+        Returns:
+            dict with the decoded fields, or None if the frame is malformed
+        """
+        if frame[0] != self.INIT_BYTE or frame[-1] != self.END_BYTE:
             logger.error(
-                "Invalid response format: expected %02X...%02X, got %s", self.INIT_BYTE, self.END_BYTE, data
+                "Invalid response format: expected %02X...%02X, got %s", self.INIT_BYTE, self.END_BYTE, frame
             )
             return None
 
-        checksum = data[17]
-        # Checksum is XOR of bytes 2-18 (excluding init and end byte)
-        calculated_checksum = self._calculate_checksum(data[1:-2])
+        if raw is None:
+            raw = bytes(frame)
+
+        checksum = frame[17]
+        if _decode_frame_fields_nb is not None:
+            # JIT path: checksum fold and all six pair decodes in native code
+            (
+                calculated_checksum,
+                i_measured,
+                u_measured,
+                stored_charge,
+                i_setting,
+                u_cutoff,
+                max_time,
+            ) = _decode_frame_fields_nb(raw)
+        else:
+            # Checksum is XOR of bytes 2-18 (excluding init and end byte);
+            # the memoryview slice folds in C without copying the frame
+            calculated_checksum = reduce(operator.xor, memoryview(raw)[1:17], 0)
+
+            # Inline the pair decode ((msb << 8 | lsb) - msb*16) for the six
+            # measurement fields; one unpacked tuple, no per-field calls
+            i_measured = (frame[2] << 8 | frame[3]) - frame[2] * 16
+            u_measured = (frame[4] << 8 | frame[5]) - frame[4] * 16
+            stored_charge = (frame[6] << 8 | frame[7]) - frame[6] * 16
+            i_setting = (frame[10] << 8 | frame[11]) - frame[10] * 16
+            u_cutoff = (frame[12] << 8 | frame[13]) - frame[12] * 16
+            max_time = (frame[14] << 8 | frame[15]) - frame[14] * 16
+
         if checksum != calculated_checksum:
             logger.warning("Checksum mismatch: expected %02X, got %02X", calculated_checksum, checksum)
             # raise CommandError(f"Checksum mismatch: expected {calculated_checksum}, got {checksum}")
 
         # Decode regime
-        regime = data[1]
+        regime = frame[1]
+        # `or` defers the UNKNOWN_* f-string to the miss case; on hits the
+        # fallback string is never built
         mode = regime % 10
-        mode_str = self.MODE_NAMES.get(mode, f"UNKNOWN_{mode}")
+        mode_str = self.MODE_NAMES.get(mode) or f"UNKNOWN_{mode}"
         state = regime // 10
-        state_str = self.RESP_STATE_NAMES.get(state, f"UNKNOWN_{state}")
-
-        i_measured = self.decode_value(data[2:4])
-        u_measured = self.decode_value(data[4:6])
-        stored_charge = self.decode_value(data[6:8])
-        unk1 = data[8:10].hex()  # Unknown bytes (always 0000h)
+        state_str = self.RESP_STATE_NAMES.get(state) or f"UNKNOWN_{state}"
 
-        # DATA setting
-        i_setting = self.decode_value(data[10:12])
-        u_cutoff = self.decode_value(data[12:14])
-        max_time = self.decode_value(data[14:16])
+        unk1 = f"{frame[8]:02x}{frame[9]:02x}"  # Unknown bytes (always 0000h)
 
         # Seems to be identification/model (always 05h according to the image)
-        ident = data[16]
-
-        return OrderedDict(
-            [
-                ("regime", f"{regime:02x}"),
-                ("mode", mode_str),
-                ("state", state_str),
-                ("i_measured", i_measured / 1000.0),  # Assuming the value is in 0.0001A units
-                ("u_measured", u_measured / 1000.0),  # Assuming the value is in 0.001V units
-                ("stored_charge", stored_charge),
-                ("i_setting", i_setting / 1000.0),  # Assuming the value is in 0.001A units
-                ("u_cutoff", u_cutoff / 100.0),  # Assuming the value is in 0.001V units
-                ("max_time", max_time),
-                ("ident", f"{ident:02x}"),
-                ("unk1", unk1),
-                ("raw_data", data.hex()),
-            ]
-        )
+        ident = frame[16]
+
+        # Plain dict: insertion order is guaranteed since 3.7 and both
+        # allocation and item assignment are cheaper than OrderedDict
+        return {
+            "regime": f"{regime:02x}",
+            "mode": mode_str,
+            "state": state_str,
+            "i_measured": i_measured / 1000.0,  # Assuming the value is in 0.0001A units
+            "u_measured": u_measured / 1000.0,  # Assuming the value is in 0.001V units
+            "stored_charge": stored_charge,
+            "i_setting": i_setting / 1000.0,  # Assuming the value is in 0.001A units
+            "u_cutoff": u_cutoff / 100.0,  # Assuming the value is in 0.001V units
+            "max_time": max_time,
+            "ident": f"{ident:02x}",
+            "unk1": unk1,
+            "raw_data": raw.hex(),
+        }
+
+    def _wait_for_state(self, state, max_frames=3, writer_cb=None):
+        """
+        Read frames until the device reports the given state.
+
+        Replaces the fixed post-command settling sleep: returns as soon as a
+        frame with the expected state arrives instead of always burning the
+        full interval and discarding valid measurements.
+
+        Args:
+            state (str): Expected state name (e.g. "WORKING")
+            max_frames (int): Give up after this many frames/read attempts
+            writer_cb (callable, optional): Forwarded each parsed frame
+
+        Returns:
+            bool: True if the expected state was seen
+        """
+        attempts = 0
+        while attempts < max_frames:
+            frames = self.read_measurements()
+            if not frames:
+                attempts += 1
+                continue
+            for data in frames:
+                if writer_cb is not None:
+                    writer_cb(data)
+                if data["state"] == state:
+                    return True
+                attempts += 1
+        return False
 
     def read_until_complete(self, writer_cb=None):
+        # No fixed sleep: read_measurement blocks on the serial port until a
+        # frame arrives (or the port timeout elapses), so each iteration
+        # wakes exactly when the device sends, without drift.
         self.discard_unread()
+        # Hoist the per-iteration attribute lookups out of the loop
+        read_measurements = self.read_measurements
+        debug = logger.debug
         counter = 0
         while counter < 4:
-            time.sleep(1)
-            data = self.read_measurement()
-            if not data:
-                continue
-            logging.debug("Got data: %s", data)
-            if writer_cb is not None:
-                writer_cb(data)
-            if data["state"] in ("COMPLETED", "IDLE"):
-                counter += 1
+            # Consume every frame queued since the last pass in one batch
+            for data in read_measurements():
+                debug("Got data: %s", data)
+                if writer_cb is not None:
+                    writer_cb(data)
+                if data["state"] in ("COMPLETED", "IDLE"):
+                    counter += 1
 
     def charge_cccv(self, voltage, current, timeout=timedelta(0), writer_cb=None):
         """
@@ -525,8 +753,7 @@ class EBCDevice:
             writer_cb (callable, optional): Callback function to write data during charging
         """
         self.start_charge_cccv(voltage=voltage, current=current, timeout=timeout)
-        time.sleep(2.5)
-        self.discard_unread()
+        self._wait_for_state("WORKING", writer_cb=writer_cb)
         self.read_until_complete(writer_cb=writer_cb)
 
     def discharge_cc(self, current, cutoff_voltage, timeout=timedelta(0), writer_cb=None):
@@ -541,8 +768,7 @@ class EBCDevice:
             writer_cb (callable, optional): Callback function to write data during discharging
         """
         self.start_discharge_cc(current=current, cutoff_voltage=cutoff_voltage, timeout=timeout)
-        time.sleep(2.5)
-        self.discard_unread()
+        self._wait_for_state("WORKING", writer_cb=writer_cb)
         self.read_until_complete(writer_cb=writer_cb)
 
     def discharge_cp(self, power, cutoff_voltage, timeout=timedelta(0), writer_cb=None):
@@ -557,8 +783,7 @@ class EBCDevice:
             writer_cb (callable, optional): Callback function to write data during discharging
         """
         self.start_discharge_cp(power=power, cutoff_voltage=cutoff_voltage, timeout=timeout)
-        time.sleep(2.5)
-        self.discard_unread()
+        self._wait_for_state("WORKING", writer_cb=writer_cb)
         self.read_until_complete(writer_cb=writer_cb)
 
     def discharge_cv(self, target_voltage, writer_cb=None):
@@ -576,18 +801,22 @@ class EBCDevice:
             if not data:
                 continue
             if data["u_measured"] < target_voltage:
-                logging.warning("Voltage %.3fV is already below target %.3fV", data["u_measured"], target_voltage)
+                logger.warning("Voltage %.3fV is already below target %.3fV", data["u_measured"], target_voltage)
                 return
             break
 
-        logging.info("Starting discharge to %.3fV with initial current %.3fA", target_voltage, current)
+        logger.info("Starting discharge to %.3fV with initial current %.3fA", target_voltage, current)
         self.start_discharge_cc(current, target_voltage)
-        time.sleep(2.5)
-        self.discard_unread()
+        self._wait_for_state("WORKING", writer_cb=writer_cb)
 
+        # The cutoff voltage and timeout stay fixed across the sweep; encode
+        # them once and rebuild only the current bytes per adjustment
+        tail_enc = self.encode_value(int(target_voltage * self.V_MULT)) + self.encode_value(0)
+
+        # Hoisted out of the loop; each is an attribute lookup per iteration
+        read_measurement = self.read_measurement
         while 1:
-            time.sleep(1)
-            data = self.read_measurement()
+            data = read_measurement()
             if not data:
                 continue
             if writer_cb:
@@ -596,10 +825,14 @@ class EBCDevice:
                 current *= 0.8
                 if current < 0.05:
                     break
-                logging.info("Adjusting discharge current to %.3fA", current)
-                self.adjust_discharge_cc(current, target_voltage)
-                time.sleep(2.5)
-                self.discard_unread()
+                logger.info("Adjusting discharge current to %.3fA", current)
+                self.send_command(
+                    self.MODE_D_CC,
+                    self.CMD_START,
+                    self.encode_value(int(current * self.I_MULT)) + tail_enc,
+                    post_delay=0,
+                )
+                self._wait_for_state("WORKING", writer_cb=writer_cb)
         return
 
     def charge_cv(self, target_voltage, writer_cb=None):
@@ -617,18 +850,22 @@ class EBCDevice:
             if not data:
                 continue
             if data["u_measured"] > target_voltage:
-                logging.warning("Voltage %.3fV is already above target %.3fV", data["u_measured"], target_voltage)
+                logger.warning("Voltage %.3fV is already above target %.3fV", data["u_measured"], target_voltage)
                 return
             break
 
-        logging.info("Starting charge to %.3fV with initial current %.3fA", target_voltage, current)
+        logger.info("Starting charge to %.3fV with initial current %.3fA", target_voltage, current)
         self.start_charge_cccv(voltage=target_voltage, current=current)
-        time.sleep(2.5)
-        self.discard_unread()
+        self._wait_for_state("WORKING", writer_cb=writer_cb)
 
+        # The target voltage and timeout stay fixed across the sweep; encode
+        # them once and rebuild only the current bytes per adjustment
+        tail_enc = self.encode_value(int(target_voltage * self.V_MULT)) + self.encode_value(0)
+
+        # Hoisted out of the loop; each is an attribute lookup per iteration
+        read_measurement = self.read_measurement
         while 1:
-            time.sleep(1)
-            data = self.read_measurement()
+            data = read_measurement()
             if not data:
                 continue
             if writer_cb:
@@ -637,8 +874,12 @@ class EBCDevice:
                 current *= 0.8
                 if current < 0.05:
                     break
-                logging.info("Adjusting charge current to %.3fA", current)
-                self.adjust_charge_cccv(voltage=target_voltage, current=current)
-                time.sleep(2.5)
-                self.discard_unread()
+                logger.info("Adjusting charge current to %.3fA", current)
+                self.send_command(
+                    self.MODE_C_CCCV,
+                    self.CMD_ADJUST,
+                    self.encode_value(int(current * self.I_MULT)) + tail_enc,
+                    post_delay=0,
+                )
+                self._wait_for_state("WORKING", writer_cb=writer_cb)
         return